@@ -23,21 +23,95 @@ Example usage::
 from __future__ import annotations
 
 import argparse
+import asyncio
+import atexit
 import json
 import logging
+import os
+import re
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Optional
-from urllib.error import HTTPError, URLError
 from urllib.parse import parse_qs, urlparse
-from urllib.request import urlopen
+from xml.etree import ElementTree
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson parses multi-MB caption payloads several times faster than the
+# stdlib json module; fall back transparently when it is not installed.
+# Both accept bytes, so responses never need an intermediate decode.
+try:
+    from orjson import loads as _loads  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    _loads = json.loads
 
 LOGGER = logging.getLogger(__name__)
 
+# A single pooled session keeps connections to youtube.com alive, so the
+# TCP+TLS handshake is paid once instead of per request. Transient 5xx
+# responses are retried with exponential backoff on the pooled connection
+# rather than surfacing as a failed strategy.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.25,
+            status_forcelist=[500, 502, 503, 504],
+        ),
+    ),
+)
+
 # Default language candidates to try. The official timedtext endpoint accepts
 # BCP-47 language codes, so we try a few English variants that commonly exist.
 LANGUAGE_CANDIDATES = ("en", "en-US", "en-GB")
 
+# Matches the non-content lines of SRT/VTT payloads (cue indexes, timing
+# lines and the WEBVTT header) so they can be stripped in a single pass.
+# Operates on bytes so payloads are only decoded after filtering; the tail
+# tolerates \r so CRLF payloads are filtered like LF ones.
+_TS_RE = re.compile(rb"^[ \t]*(?:\d+|WEBVTT.*|.*-->.*)[ \t\r]*$\n?", re.M | re.I)
+
+# A bare YouTube video id: the characters ids are drawn from, at the lengths
+# we accept when the input line is not a URL.
+_ID_RE = re.compile(r"\A[A-Za-z0-9_-]{10,19}\Z")
+
+# The v= query parameter of a youtube.com watch URL, matched directly on
+# the raw input so the common case skips urlparse/parse_qs entirely. The
+# pattern anchors on the host so lookalike URLs fall through to the
+# hostname checks below.
+_V_RE = re.compile(
+    r"\Ahttps?://(?:[A-Za-z0-9-]+\.)*youtube\.com/[^?#]*\?"
+    r"(?:[^#]*&)?v=([A-Za-z0-9_-]{10,19})"
+)
+
+
+# On-disk cache for downloaded timedtext payloads, shared between runs. It is
+# populated lazily via configure_cache() so the directory stays configurable
+# from the command line.
+_CACHE = None
+_CACHE_MISS = object()
+_CACHE_EXPIRE_SECONDS = 7 * 86400
+
+
+def configure_cache(cache_dir: Path) -> None:
+    """Enable the on-disk transcript cache stored under ``cache_dir``."""
+
+    global _CACHE
+    try:
+        from diskcache import Cache  # type: ignore
+    except ImportError:  # pragma: no cover - optional dependency
+        LOGGER.warning("diskcache is not installed; transcript caching disabled")
+        return
+    _CACHE = Cache(str(cache_dir))
+
 
 class TranscriptDownloadError(RuntimeError):
     """Raised when a transcript cannot be downloaded."""
@@ -47,19 +121,27 @@ class TranscriptNotAvailableError(TranscriptDownloadError):
     """Raised when the transcript is not available for any language."""
 
 
+@lru_cache(maxsize=4096)
 def extract_video_id(raw: str) -> str:
     """Return the YouTube video id from ``raw``.
 
-    ``raw`` can already be an id or a YouTube URL containing the id.
+    ``raw`` can already be an id or a YouTube URL containing the id. The
+    function is pure, so results are memoized; input files with duplicate
+    lines skip the URL parsing on repeats.
     """
     raw = raw.strip()
     if not raw:
         raise ValueError("empty video id/URL provided")
 
     # If the caller already provided the id just return it.
-    if all(ch.isalnum() or ch in ("-", "_") for ch in raw) and len(raw) in range(10, 20):
+    if _ID_RE.match(raw):
         return raw
 
+    # Fast path for watch URLs: one regex match instead of building the
+    # full parse_qs dict. Other URL shapes fall through to urlparse below.
+    if match := _V_RE.match(raw):
+        return match.group(1)
+
     parsed = urlparse(raw)
     if parsed.hostname in {"youtu.be"}:
         video_id = parsed.path.lstrip("/")
@@ -76,57 +158,200 @@ def extract_video_id(raw: str) -> str:
 
 
 def read_video_ids(source: Path) -> Iterable[str]:
-    for line in source.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        yield extract_video_id(line)
+    # Stream line-by-line rather than materializing the whole file; input
+    # lists can be arbitrarily long and this keeps memory flat.
+    with source.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            yield extract_video_id(line)
 
 
-def _download_json_transcript(video_id: str, language: str) -> Optional[str]:
+def _json3_to_text(payload: bytes | str) -> Optional[str]:
+    """Flatten a json3 caption document into newline-separated text."""
+
+    data = _loads(payload)
+    lines = [
+        text
+        for event in data.get("events", [])
+        for segment in event.get("segs") or ()
+        if (text := (segment.get("utf8") or "").replace("\n", " ").strip())
+    ]
+    return "\n".join(lines) or None
+
+
+def _download_json_transcript(
+    video_id: str, language: str, force: bool = False
+) -> Optional[str]:
     """Download and decode a transcript in json3 format.
 
     Returns the transcript text if the download succeeded and contained
-    meaningful content. Otherwise ``None`` is returned.
+    meaningful content. Otherwise ``None`` is returned. Definitive results
+    (including "no transcript for this language") are memoized on disk so
+    repeated runs skip the network round-trip; ``force`` skips the cache
+    read and refreshes the stored entry from the network.
+    """
+    if _CACHE is None:
+        return _download_json_transcript_uncached(video_id, language)
+
+    key = (video_id, language)
+    if not force:
+        cached = _CACHE.get(key, default=_CACHE_MISS)
+        if cached is not _CACHE_MISS:
+            LOGGER.debug("Cache hit for %s (%s)", video_id, language)
+            return cached
+
+    transcript = _download_json_transcript_uncached(video_id, language)
+    _CACHE.set(key, transcript, expire=_CACHE_EXPIRE_SECONDS)
+    return transcript
+
+
+def _read_body(response: requests.Response) -> bytes:
+    """Drain a streamed ``response`` into one growable buffer.
+
+    ``Response.content`` collects chunks into a list and joins them at the
+    end, briefly holding two copies of the payload; a ``bytearray`` grows
+    in place, keeping peak memory at roughly the payload size. Requests
+    decompresses transparently, so Content-Length cannot be trusted for an
+    exact preallocation.
+    """
+
+    buffer = bytearray()
+    for chunk in response.iter_content(65536):
+        buffer += chunk
+    return bytes(buffer)
+
+
+def _drain(response: requests.Response) -> None:
+    """Consume a streamed error body so its socket returns to the pool.
+
+    With ``stream=True`` an unread response never releases its connection;
+    on the frequent 403/404 probe outcomes the bodies are tiny, so reading
+    them is cheaper than re-handshaking on the next request.
     """
+
+    try:
+        response.content
+    except requests.RequestException:  # the socket is unusable anyway
+        pass
+
+
+@lru_cache(maxsize=512)
+def _fetch_raw(url: str) -> Optional[bytes]:
+    """Download ``url``, returning the body or ``None`` on HTTP 403/404.
+
+    Memoized per process so racing strategies (or retries) never fetch the
+    same timedtext URL twice; failures raise and are therefore not cached.
+    """
+
+    try:
+        response = _SESSION.get(url, timeout=10, stream=True)
+    except requests.RequestException as err:
+        raise TranscriptDownloadError(
+            f"Network error while downloading {url}: {err}"
+        ) from err
+
+    try:
+        response.raise_for_status()
+        return _read_body(response)
+    except requests.HTTPError as err:
+        _drain(response)
+        if err.response is not None and err.response.status_code in {404, 403}:
+            return None
+        raise TranscriptDownloadError(
+            f"HTTP error {err.response.status_code if err.response is not None else '?'}"
+            f" while downloading {url}"
+        ) from err
+    except requests.RequestException as err:
+        raise TranscriptDownloadError(
+            f"Network error while downloading {url}: {err}"
+        ) from err
+    finally:
+        response.close()
+
+
+def _download_json_transcript_uncached(video_id: str, language: str) -> Optional[str]:
     url = (
         "https://www.youtube.com/api/timedtext"
         f"?lang={language}&v={video_id}&fmt=json3"
     )
+    payload = _fetch_raw(url)
+    if payload is None or not payload.strip():
+        return None
+
+    return _json3_to_text(payload)
+
+
+@lru_cache(maxsize=512)
+def _list_timedtext_tracks(video_id: str) -> tuple[tuple[str, str], ...]:
+    """Return ``(lang_code, name)`` pairs for the video's caption tracks.
+
+    Memoized per video id so racing strategies or retries reuse the
+    listing. Raises :class:`TranscriptDownloadError` when the listing
+    cannot be obtained or understood, so the caller falls back to probing;
+    an empty tuple means a well-formed listing with no tracks.
+    """
+
+    url = f"https://video.google.com/timedtext?type=list&v={video_id}"
     try:
-        with urlopen(url, timeout=10) as response:  # nosec B310 - trusted URL
-            payload = response.read().decode("utf-8")
-    except HTTPError as err:
-        if err.code in {404, 403}:
-            return None
+        response = _SESSION.get(url, timeout=10)
+        response.raise_for_status()
+    except requests.RequestException as err:
         raise TranscriptDownloadError(
-            f"HTTP error {err.code} while downloading transcript for {video_id}"
+            f"Failed to list timedtext tracks for {video_id}: {err}"
         ) from err
-    except OSError as err:  # handles URLError and socket errors
+
+    body = response.content
+    if not body.strip():
         raise TranscriptDownloadError(
-            f"Network error while downloading transcript for {video_id}: {err}"
+            f"Empty timedtext track listing for {video_id}"
+        )
+    try:
+        root = ElementTree.fromstring(body)
+    except ElementTree.ParseError as err:
+        raise TranscriptDownloadError(
+            f"Unparseable timedtext track listing for {video_id}: {err}"
         ) from err
 
-    if not payload.strip():
-        return None
+    return tuple(
+        (track.get("lang_code", ""), track.get("name", ""))
+        for track in root.iter("track")
+        if track.get("lang_code")
+    )
 
-    data = json.loads(payload)
-    events = data.get("events", [])
-    lines = []
-    for event in events:
-        for segment in event.get("segs", []) or []:
-            text = (segment.get("utf8") or "").replace("\n", " ").strip()
-            if text:
-                lines.append(text)
-    transcript = "\n".join(lines).strip()
-    return transcript or None
 
+def _fetch_with_timedtext(video_id: str, force: bool = False) -> str:
+    """Try fetching the transcript via the timedtext endpoint.
 
-def _fetch_with_timedtext(video_id: str) -> str:
-    """Try fetching the transcript via the timedtext endpoint."""
+    The track list endpoint is queried first so only languages the video
+    actually offers are requested, instead of blindly probing every entry
+    of ``LANGUAGE_CANDIDATES`` and eating the 404s.
+    """
 
-    for language in LANGUAGE_CANDIDATES:
-        transcript = _download_json_transcript(video_id, language)
+    try:
+        available = [code for code, _ in _list_timedtext_tracks(video_id)]
+    except TranscriptDownloadError as err:
+        LOGGER.debug(
+            "Track listing failed for %s (%s); probing languages blindly",
+            video_id,
+            err,
+        )
+        available = None
+
+    if available is None:
+        candidates = list(LANGUAGE_CANDIDATES)
+    else:
+        candidates = [code for code in LANGUAGE_CANDIDATES if code in available]
+        # The uploader may have used an English variant we did not anticipate.
+        candidates += [
+            code
+            for code in available
+            if code.startswith("en") and code not in candidates
+        ]
+
+    for language in candidates:
+        transcript = _download_json_transcript(video_id, language, force)
         if transcript:
             LOGGER.debug(
                 "Retrieved transcript for %s using timedtext language %s",
@@ -154,10 +379,11 @@ def _fetch_with_youtube_transcript_api(video_id: str) -> str:
             "youtube-transcript-api is not installed"
         ) from err
 
+    # Listing the tracks once and fetching the chosen one saves the extra
+    # hop get_transcript makes when the wanted language is auto-generated.
     try:
-        segments = YouTubeTranscriptApi.get_transcript(
-            video_id, languages=list(LANGUAGE_CANDIDATES)
-        )
+        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+        transcript = transcript_list.find_transcript(list(LANGUAGE_CANDIDATES))
     except (NoTranscriptFound, TranscriptsDisabled) as err:
         raise TranscriptNotAvailableError(str(err)) from err
     except VideoUnavailable as err:
@@ -167,6 +393,13 @@ def _fetch_with_youtube_transcript_api(video_id: str) -> str:
             f"youtube-transcript-api failed for {video_id}: {err}"
         ) from err
 
+    try:
+        segments = transcript.fetch()
+    except Exception as err:  # pragma: no cover - defensive
+        raise TranscriptDownloadError(
+            f"youtube-transcript-api failed for {video_id}: {err}"
+        ) from err
+
     lines = []
     for segment in segments:
         text = (segment.get("text") or "").replace("\n", " ").strip()
@@ -183,36 +416,25 @@ def _fetch_with_youtube_transcript_api(video_id: str) -> str:
     return transcript
 
 
-def _parse_caption_payload(payload: str, extension: str) -> Optional[str]:
-    """Convert a caption payload into plain text."""
+def _parse_caption_payload(payload: bytes, extension: str) -> Optional[str]:
+    """Convert a raw caption payload into plain text.
+
+    ``payload`` stays bytes until the cue metadata has been stripped, so
+    only the transcript text itself is ever UTF-8 decoded — for multi-MB
+    captions this avoids a second full-size copy of the payload.
+    """
 
     if not payload.strip():
         return None
 
     if extension == "json3":
-        data = json.loads(payload)
-        events = data.get("events", [])
-        lines = []
-        for event in events:
-            for segment in event.get("segs", []) or []:
-                text = (segment.get("utf8") or "").replace("\n", " ").strip()
-                if text:
-                    lines.append(text)
-        return "\n".join(lines).strip() or None
+        return _json3_to_text(payload)
 
-    lines = []
-    for line in payload.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        if "-->" in line:
-            continue
-        if extension == "srt" and line.isdigit():
-            continue
-        if line.upper().startswith("WEBVTT"):
-            continue
-        lines.append(line)
-    return "\n".join(lines).strip() or None
+    # SRT and VTT share the same shape once the cue metadata is removed, so a
+    # single substitution strips it regardless of the exact extension.
+    cleaned = _TS_RE.sub(b"", payload)
+    kept = [text for line in cleaned.splitlines() if (text := line.strip())]
+    return b"\n".join(kept).decode("utf-8", errors="ignore") or None
 
 
 @dataclass
@@ -235,39 +457,79 @@ def _iter_caption_candidates(info: dict) -> Iterable[CaptionCandidate]:
                 yield CaptionCandidate(url=url, extension=ext)
 
 
+_YDL_LOCAL = threading.local()
+
+
+def _ydl():
+    """Return a per-thread ``YoutubeDL`` instance.
+
+    Construction registers every extractor and compiles matching rules, so
+    the cost is paid once per worker thread instead of once per video.
+    ``YoutubeDL`` mutates instance state (cookiejar, download counters,
+    error bookkeeping) during ``extract_info`` and is not thread-safe, so
+    the racing worker threads must not share one instance. Each instance
+    is closed at interpreter exit, matching the context manager the
+    per-call construction used.
+    """
+
+    ydl = getattr(_YDL_LOCAL, "instance", None)
+    if ydl is None:
+        from yt_dlp import YoutubeDL  # type: ignore
+
+        ydl = YoutubeDL(
+            {
+                "quiet": True,
+                "skip_download": True,
+                "writesubtitles": True,
+                "writeautomaticsub": True,
+                "logger": LOGGER,
+            }
+        )
+        atexit.register(ydl.close)
+        _YDL_LOCAL.instance = ydl
+    return ydl
+
+
 def _fetch_with_yt_dlp(video_id: str) -> str:
     """Fetch transcript information via yt-dlp."""
 
     try:
-        from yt_dlp import YoutubeDL  # type: ignore
+        ydl = _ydl()
     except ImportError as err:  # pragma: no cover - optional dependency
         raise TranscriptDownloadError("yt-dlp is not installed") from err
 
-    ydl_options = {
-        "quiet": True,
-        "skip_download": True,
-        "writesubtitles": True,
-        "writeautomaticsub": True,
-        "logger": LOGGER,
-    }
-
-    with YoutubeDL(ydl_options) as ydl:
+    try:
         info = ydl.extract_info(video_id, download=False)
+    except Exception as err:  # yt-dlp raises DownloadError for bot checks etc.
+        raise TranscriptDownloadError(
+            f"yt-dlp failed to extract info for {video_id}: {err}"
+        ) from err
 
     for candidate in _iter_caption_candidates(info):
         try:
-            with urlopen(candidate.url, timeout=10) as response:  # nosec B310
-                payload = response.read().decode("utf-8", errors="ignore")
-        except HTTPError as err:
-            if err.code in {403, 404}:
+            response = _SESSION.get(candidate.url, timeout=10, stream=True)
+        except requests.RequestException as err:
+            raise TranscriptDownloadError(
+                f"Network error downloading yt-dlp captions for {video_id}: {err}"
+            ) from err
+
+        try:
+            response.raise_for_status()
+            payload = _read_body(response)
+        except requests.HTTPError as err:
+            _drain(response)
+            if err.response is not None and err.response.status_code in {403, 404}:
                 continue
             raise TranscriptDownloadError(
-                f"HTTP error {err.code} downloading yt-dlp captions for {video_id}"
+                f"HTTP error {err.response.status_code if err.response is not None else '?'}"
+                f" downloading yt-dlp captions for {video_id}"
             ) from err
-        except URLError as err:
+        except requests.RequestException as err:
             raise TranscriptDownloadError(
                 f"Network error downloading yt-dlp captions for {video_id}: {err}"
             ) from err
+        finally:
+            response.close()
 
         transcript = _parse_caption_payload(payload, candidate.extension)
         if transcript:
@@ -311,35 +573,187 @@ def fetch_transcript(video_id: str) -> str:
     raise TranscriptDownloadError("Unable to fetch transcript for unknown reasons")
 
 
+def _write_file(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` with a single open/write/close.
+
+    Bypasses pathlib's TextIOWrapper machinery; the caller is responsible
+    for the parent directory existing (run() creates it once up front).
+    """
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
 def save_transcript(destination: Path, video_id: str, transcript: str) -> None:
-    destination.mkdir(parents=True, exist_ok=True)
     output_path = destination / f"{video_id}.txt"
-    output_path.write_text(transcript, encoding="utf-8")
+    _write_file(output_path, transcript.encode("utf-8"))
     LOGGER.info("Saved transcript for %s to %s", video_id, output_path)
 
 
 def save_error(destination: Path, video_id: str, error: Exception) -> None:
-    destination.mkdir(parents=True, exist_ok=True)
     payload = {
         "video_id": video_id,
         "error_type": type(error).__name__,
         "message": str(error),
     }
-    (destination / f"{video_id}.error.json").write_text(
-        json.dumps(payload, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
+    _write_file(
+        destination / f"{video_id}.error.json",
+        (json.dumps(payload, indent=2, ensure_ascii=False) + "\n").encode("utf-8"),
     )
     LOGGER.error("Failed to fetch transcript for %s: %s", video_id, error)
 
 
-def run(input_file: Path, output_dir: Path) -> None:
+async def _fetch_transcript_async(video_id: str, force: bool = False) -> str:
+    """Race all fetch strategies and return the first transcript to arrive.
+
+    Sequential fallback pays for every failed strategy before the next one
+    starts; yt-dlp alone often takes seconds even when timedtext answers in
+    milliseconds. Running the strategies concurrently makes the latency the
+    fastest successful strategy rather than the sum of the attempts. Each
+    strategy wraps a synchronous library, so it runs in a worker thread;
+    cancelling a loser only abandons the await, the thread winds down on
+    its own.
+    """
+
+    strategies = (
+        _fetch_with_timedtext,
+        _fetch_with_youtube_transcript_api,
+        _fetch_with_yt_dlp,
+    )
+    # Tuple order doubles as the preference order: when several strategies
+    # finish in the same wake-up, the earliest listed one wins, so output
+    # normalization stays deterministic across runs (timedtext first).
+    priorities = {
+        strategy.__name__: index for index, strategy in enumerate(strategies)
+    }
+    # Only the timedtext strategy has a cache layer, so it alone takes the
+    # force flag; the other strategies always hit their backing service.
+    pending = {
+        asyncio.create_task(
+            asyncio.to_thread(strategy, video_id, force)
+            if strategy is _fetch_with_timedtext
+            else asyncio.to_thread(strategy, video_id),
+            name=strategy.__name__,
+        )
+        for strategy in strategies
+    }
+    last_error: Optional[Exception] = None
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            # Consume every finished task, even once a winner is known, so
+            # losing exceptions are retrieved instead of warned about.
+            winner: Optional[str] = None
+            for task in sorted(done, key=lambda task: priorities[task.get_name()]):
+                try:
+                    transcript = task.result()
+                except TranscriptNotAvailableError as err:
+                    LOGGER.debug(
+                        "Strategy %s did not have a transcript: %s",
+                        task.get_name(),
+                        err,
+                    )
+                    last_error = err
+                except TranscriptDownloadError as err:
+                    LOGGER.debug(
+                        "Strategy %s failed to download transcript: %s",
+                        task.get_name(),
+                        err,
+                    )
+                    if not isinstance(last_error, TranscriptNotAvailableError):
+                        last_error = err
+                except Exception as err:  # defensive - a buggy strategy must
+                    # not abort the race while others may still succeed
+                    LOGGER.debug(
+                        "Strategy %s raised unexpectedly: %s",
+                        task.get_name(),
+                        err,
+                    )
+                    if not isinstance(last_error, TranscriptNotAvailableError):
+                        last_error = err
+                else:
+                    if transcript and winner is None:
+                        winner = transcript
+            if winner:
+                return winner
+    finally:
+        for task in pending:
+            task.cancel()
+
+    if isinstance(last_error, TranscriptNotAvailableError):
+        raise last_error
+    if last_error:
+        raise TranscriptDownloadError(str(last_error))
+
+    raise TranscriptDownloadError("Unable to fetch transcript for unknown reasons")
+
+
+async def run_async(
+    input_file: Path,
+    output_dir: Path,
+    concurrency: int = 16,
+    force: bool = False,
+) -> None:
+    """Fetch transcripts for every video id concurrently.
+
+    Each video is independent and the workload is network-bound, so up to
+    ``concurrency`` fetches are kept in flight at once. Videos whose
+    transcript file already exists are skipped unless ``force`` is set.
+    """
+
+    # The per-URL caches only exist to deduplicate fetches within one run;
+    # clearing them here keeps a long-lived process from pinning hundreds
+    # of multi-MB payloads (or stale track listings) across invocations.
+    _fetch_raw.cache_clear()
+    _list_timedtext_tracks.cache_clear()
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def worker(video_id: str) -> None:
+        # File writes are pushed to worker threads so a slow disk never
+        # stalls the event loop while other fetches are in flight.
+        async with semaphore:
+            try:
+                transcript = await _fetch_transcript_async(video_id, force)
+            except TranscriptDownloadError as err:
+                await asyncio.to_thread(save_error, output_dir, video_id, err)
+            else:
+                await asyncio.to_thread(
+                    save_transcript, output_dir, video_id, transcript
+                )
+
+    video_ids = []
+    seen = set()
     for video_id in read_video_ids(input_file):
-        try:
-            transcript = fetch_transcript(video_id)
-        except TranscriptDownloadError as err:
-            save_error(output_dir, video_id, err)
-        else:
-            save_transcript(output_dir, video_id, transcript)
+        if video_id in seen:
+            LOGGER.debug("Skipping duplicate input id %s", video_id)
+            continue
+        seen.add(video_id)
+        if not force and (output_dir / f"{video_id}.txt").exists():
+            LOGGER.debug("Skipping %s: transcript already downloaded", video_id)
+            continue
+        video_ids.append(video_id)
+    tasks = [worker(video_id) for video_id in video_ids]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for video_id, result in zip(video_ids, results):
+        if isinstance(result, BaseException):
+            LOGGER.error("Unexpected failure for %s: %s", video_id, result)
+
+
+def run(
+    input_file: Path,
+    output_dir: Path,
+    concurrency: int = 16,
+    force: bool = False,
+) -> None:
+    asyncio.run(run_async(input_file, output_dir, concurrency, force=force))
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -350,6 +764,23 @@ def build_parser() -> argparse.ArgumentParser:
         type=Path,
         help="Directory where the transcripts will be stored",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=16,
+        help="Maximum number of transcripts fetched concurrently",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-download transcripts even if the output file already exists",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=Path(".transcript_cache"),
+        help="Directory for the on-disk cache of downloaded caption payloads",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -362,4 +793,5 @@ def build_parser() -> argparse.ArgumentParser:
 if __name__ == "__main__":
     args = build_parser().parse_args()
     logging.basicConfig(level=getattr(logging, args.log_level))
-    run(args.input, args.output)
+    configure_cache(args.cache_dir)
+    run(args.input, args.output, concurrency=args.jobs, force=args.force)